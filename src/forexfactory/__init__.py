@@ -1,6 +1,15 @@
 """
 Scrape ForexFactory.com calendar events and return as pandas DataFrames.
 """
-from .scraper import scrape_range_pandas
 
-__all__ = ["scrape_range_pandas"]
\ No newline at end of file
+from .constants import DEFAULT_CONCURRENCY
+
+__all__ = ["scrape_range_pandas", "DEFAULT_CONCURRENCY"]
+
+
+def __getattr__(name: str):
+    """Import the scraper (nodriver, pandas) only when it is first used."""
+    if name == "scrape_range_pandas":
+        from .scraper import scrape_range_pandas
+        return scrape_range_pandas
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
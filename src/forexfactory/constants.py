@@ -0,0 +1,5 @@
+# src/forexfactory/constants.py
+
+# Browser tabs scraping days in parallel; kept low to stay under FF rate limits.
+# Kept out of scraper so the CLI can show it without importing nodriver.
+DEFAULT_CONCURRENCY = 3
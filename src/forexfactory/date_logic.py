@@ -2,19 +2,26 @@
 
 from datetime import datetime
 
+# FF's lowercase month abbreviations; strftime('%b') would follow the locale
+MONTHS = ("jan", "feb", "mar", "apr", "may", "jun",
+          "jul", "aug", "sep", "oct", "nov", "dec")
+
+def build_url_for_day(d: datetime) -> str:
+    """
+    Builds a ForexFactory calendar param of the form: ?day=nov05.2025
+    """
+    return f"day={MONTHS[d.month - 1]}{d.day:02d}.{d.year}"
+
 def build_url_for_partial_range(start_dt: datetime, end_dt: datetime) -> str:
     """
     Builds a ForexFactory calendar param of the form: ?range=dec20.2024-dec30.2024
     """
     def ff_str(d: datetime):
-        return d.strftime('%b').lower() + str(d.day) + '.' + str(d.year)
+        return f"{MONTHS[d.month - 1]}{d.day}.{d.year}"
     return "range=" + ff_str(start_dt) + "-" + ff_str(end_dt)
 
 def build_url_for_full_month(year: int, month: int) -> str:
     """
     Builds a param like: ?month=jan.2025
     """
-    dt = datetime(year, month, 1)
-    m_str = dt.strftime('%b').lower()
-    y_str = dt.strftime('%Y')
-    return "month=" + m_str + "." + y_str
+    return f"month={MONTHS[month - 1]}.{year}"
@@ -1,18 +1,24 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
 from typing import Optional
 from forex_common import Currency
-import re
+import sys
 
-class Impact(Enum):
+_CURRENCY_CACHE: dict[str, Currency] = {}
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+class Impact(IntEnum):
     LOW = 1
     MEDIUM = 2
     HIGH = 3
     HOLIDAY = 4
     UNKNOWN = 5
 
-@dataclass
+@dataclass(**_SLOTS)
 class CalendarEvent:
     """Represents a single economic calendar event from ForexFactory."""
     time: datetime  # Timezone-aware datetime
@@ -24,31 +30,75 @@ class CalendarEvent:
     previous: Optional[str] = None
     detail: Optional[str] = None
 
+# Impact titles as ForexFactory emits them; other spellings are classified
+# by _slow_normalize_impact and added here on first sight.
+_IMPACT_MAP: dict[str, Impact] = {
+    "High Impact Expected": Impact.HIGH,
+    "Medium Impact Expected": Impact.MEDIUM,
+    "Low Impact Expected": Impact.LOW,
+    "Non-Economic": Impact.HOLIDAY,
+    "": Impact.UNKNOWN,
+}
+
 def normalize_impact(text: str) -> Impact:
     """Convert impact text to Impact enum."""
-    text = (text or "").lower()
-    if "high" in text:
-        return Impact.HIGH
-    elif "medium" in text:
-        return Impact.MEDIUM
-    elif "low" in text:
-        return Impact.LOW
-    elif "non-economic" in text or "holiday" in text:
-        return Impact.HOLIDAY
-    return Impact.UNKNOWN
+    impact = _IMPACT_MAP.get(text)
+    if impact is None:
+        impact = _slow_normalize_impact(text)
+    return impact
+
+def _slow_normalize_impact(text: str) -> Impact:
+    """Classify impact text by substring and remember the result for text."""
+    if not text:
+        return Impact.UNKNOWN
+    lowered = text.lower()
+    if "high" in lowered:
+        impact = Impact.HIGH
+    elif "medium" in lowered:
+        impact = Impact.MEDIUM
+    elif "low" in lowered:
+        impact = Impact.LOW
+    elif "non-economic" in lowered or "holiday" in lowered:
+        impact = Impact.HOLIDAY
+    else:
+        impact = Impact.UNKNOWN
+    _IMPACT_MAP[text] = impact
+    return impact
+
+def currency_for_symbol(symbol: str) -> Currency:
+    """Return a shared Currency for symbol, constructing it only on first use."""
+    currency = _CURRENCY_CACHE.get(symbol)
+    if currency is None:
+        currency = _CURRENCY_CACHE.setdefault(symbol, Currency(symbol=symbol))
+    return currency
 
 def parse_rows(rows, base_date: datetime) -> list[CalendarEvent]:
+    """
+    Convert nodriver-serialised calendar rows into CalendarEvents.
+
+    Rows without a time inherit the previous row's time, so this stays a
+    single sequential pass; time parsing is memoized per distinct time text.
+    """
     events = []
     time = '0:00am'
     for row in rows:
         # row looks like: {"type":"object","value":[["currency",{"type":"string","value":"EUR"}], ...]}
-        values = {k: v["value"] for k, v in row["value"]}
+        # read only the fields we use, without building a dict per row
+        ev = t = cur = imp = None
+        for k, v in row["value"]:
+            if k == "event":
+                ev = v["value"]
+            elif k == "time":
+                t = v["value"]
+            elif k == "currency":
+                cur = v["value"]
+            elif k == "impact":
+                imp = v["value"]
 
         # skip date-breakers with no event
-        if not values.get("event"):
+        if not ev:
             continue
 
-        t = values.get("time", '')
         if t and len(t) > 5: # e.g. '2:30pm'
             time = t
         # else use the time from previous event
@@ -57,9 +107,9 @@ def parse_rows(rows, base_date: datetime) -> list[CalendarEvent]:
 
         events.append(CalendarEvent(
             time=dtime,
-            currency=Currency(symbol=values.get("currency", "")),
-            impact=normalize_impact(values.get("impact", "")),
-            event=values.get("event", "")
+            currency=currency_for_symbol(cur or ""),
+            impact=normalize_impact(imp or ""),
+            event=ev
             # actual=values.get("actual", ""),
             # forecast=values.get("forecast", ""),
             # previous=values.get("previous", ""),
@@ -68,35 +118,68 @@ def parse_rows(rows, base_date: datetime) -> list[CalendarEvent]:
         ))
     return events
 
+_END_OF_DAY = (23, 59, 59)
+
+# (hour, minute, second) for ForexFactory's non-clock time labels
+_SENTINEL_TIMES: dict[str, tuple[int, int, int]] = {
+    "all day": (0, 0, 0),
+    "day 1": _END_OF_DAY,
+    "day 2": _END_OF_DAY,
+    "data": (0, 0, 1),
+}
+
+def parse_hhmm(time_lower: str) -> Optional[tuple[int, int]]:
+    """
+    Parse lower-cased 'h:mm', 'hh:mmam' or 'hh:mm pm' into a 24-hour (hour, minute).
+    Returns None if the text holds no time.
+    """
+    head, colon, rest = time_lower.partition(':')
+    if not colon:
+        return None
+    hh_str = head[-2:]
+    if not hh_str.isdecimal():
+        hh_str = hh_str[-1:]
+        if not hh_str.isdecimal():
+            return None
+    mm_str = rest[:2]
+    if len(mm_str) != 2 or not mm_str.isdecimal():
+        return None
+    hh = int(hh_str)
+    ampm = rest[2:].lstrip()[:2]
+    if ampm == 'pm' and hh < 12:
+        hh += 12
+    elif ampm == 'am' and hh == 12:
+        hh = 0
+    return hh, int(mm_str)
+
 def parse_time_to_datetime(time_text: str, base_date: datetime) -> datetime:
     """
-    Shared time parsing logic for both extraction modes.
-    Converts ForexFactory time text to datetime object.
+    Converts ForexFactory time text to a datetime on base_date's day (with its tzinfo).
+    Results are memoized, since the same time text recurs across a day's events.
     """
-    event_dt = base_date
+    # Aware datetimes compare by instant, so the tzinfo must be part of the cache
+    # key or e.g. 10:00+01:00 would be answered with a result cached for 09:00+00:00
+    return _parse_time_cached(time_text, base_date, base_date.tzinfo)
+
+@lru_cache(maxsize=4096)
+def _parse_time_cached(time_text: str, base_date: datetime, _tzinfo) -> datetime:
+    y, mo, d, tz = base_date.year, base_date.month, base_date.day, base_date.tzinfo
     time_lower = time_text.lower()
-    
-    if "day" in time_lower and "all day" in time_lower:
-        event_dt = event_dt.replace(hour=0, minute=0, second=0)
-    elif "day" in time_lower:
-        event_dt = event_dt.replace(hour=23, minute=59, second=59)
-    elif "data" in time_lower:
-        event_dt = event_dt.replace(hour=0, minute=0, second=1)
-    else:
-        m = re.search(r'(\d{1,2}):(\d{2})\s*(am|pm)?', time_lower)
-        if m:
-            hh = int(m.group(1))
-            mm = int(m.group(2))
-            ampm = m.group(3)
-            if ampm:
-                ampm = ampm.lower()
-                if ampm == 'pm' and hh < 12:
-                    hh += 12
-                if ampm == 'am' and hh == 12:
-                    hh = 0
-            try:
-                event_dt = event_dt.replace(hour=hh, minute=mm, second=0)
-            except Exception:
-                event_dt = event_dt.replace(hour=0, minute=0, second=0)
-    
-    return event_dt
+
+    hms = _SENTINEL_TIMES.get(time_lower)
+    if hms is None:
+        if "day" in time_lower:
+            hms = _SENTINEL_TIMES["all day"] if "all day" in time_lower else _END_OF_DAY
+        elif "data" in time_lower:
+            hms = _SENTINEL_TIMES["data"]
+    if hms is not None:
+        return datetime(y, mo, d, *hms, tzinfo=tz)
+
+    hhmm = parse_hhmm(time_lower)
+    if not hhmm:
+        return base_date
+    hh, mm = hhmm
+    try:
+        return datetime(y, mo, d, hh, mm, 0, tzinfo=tz)
+    except ValueError:
+        return datetime(y, mo, d, 0, 0, 0, tzinfo=tz)
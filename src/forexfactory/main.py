@@ -3,17 +3,12 @@ import logging
 import argparse
 from datetime import datetime, timedelta
 import asyncio
-from .scraper import scrape_range_pandas
-from .utils.logging import configure_logging
+
+from .constants import DEFAULT_CONCURRENCY
 
 
 async def main():
     """Main CLI entry point."""
-    configure_logging()
-    logger = logging.getLogger(__name__)
-    logging.getLogger("nodriver").setLevel(logging.WARNING)
-    logging.getLogger("websockets").setLevel(logging.WARNING)
-
     today = datetime.today()
     parser = argparse.ArgumentParser(description="ForexFactory Calendar Scraper")
     parser.add_argument('--start', type=str, required=True,
@@ -24,15 +19,40 @@ async def main():
         help='Output CSV file')
     parser.add_argument('--details', action='store_true', default=False,
         help='Scrape event details')
+    parser.add_argument('--verbose', action='store_true', default=False,
+        help='Log at DEBUG level (every calendar row; slow on long ranges)')
+    parser.add_argument('--plain-log', action='store_true', default=False,
+        help='Log through a plain stream handler instead of Rich (faster, no colours)')
+    parser.add_argument('--skip-existing', action='store_true', default=False,
+        help='Skip days the CSV already has events for (except the last two days and later)')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+        help='Browser tabs scraping days in parallel (default: %(default)s)')
+    parser.add_argument('--detail-cache', type=str, default=None,
+        help='SQLite file caching scraped details across runs (with --details)')
+    parser.add_argument('--profile-dir', type=str, default=None,
+        help='Chrome profile directory to reuse across runs (keeps its cache warm)')
 
     args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error('--concurrency must be at least 1')
+
+    # Heavy imports (nodriver, pandas, rich) only once the arguments are valid
+    from .scraper import scrape_range_pandas
+    from .utils.logging import configure_logging
+
+    configure_logging(logging.DEBUG if args.verbose else logging.INFO,
+                      rich=not args.plain_log)
+    logger = logging.getLogger(__name__)
 
     from_date = datetime.fromisoformat(args.start)
     to_date = datetime.fromisoformat(args.end)
 
     logger.info(f"Scraping {args.start} to {args.end}")
     df = await scrape_range_pandas(from_date, to_date,
-        output_csv=args.csv, scrape_details=args.details)
+        output_csv=args.csv, scrape_details=args.details,
+        concurrency=args.concurrency,
+        detail_cache=args.detail_cache, profile_dir=args.profile_dir,
+        skip_existing=args.skip_existing)
     logger.info(f"Scraped {len(df)} events")
 
 
@@ -1,15 +1,133 @@
 import asyncio
-import re
+import json
 import logging
 import pandas as pd
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 import nodriver as uc
-from forex_common import Currency
-from .utils.csv_util import ensure_csv_header, read_existing_data, merge_new_data, write_data_to_csv
-from .event import CalendarEvent, Impact, normalize_impact, parse_time_to_datetime
+from .utils.csv_util import (ensure_csv_header, read_existing_data, merge_new_data,
+    write_data_to_csv, append_data_to_csv, build_detail_index, CSV_COLUMNS, MERGE_KEY)
+from .utils.detail_cache import DetailCache
+from .constants import DEFAULT_CONCURRENCY
+from .date_logic import build_url_for_day
+from .event import (CalendarEvent, Impact, normalize_impact, parse_time_to_datetime,
+    parse_hhmm, currency_for_symbol)
 
 logger = logging.getLogger(__name__)
 
+# With skip_existing, days from this many days ago onwards (today and later included)
+# are still rescraped, as their actuals may be pending or their forecasts revised
+REFRESH_RECENT_DAYS = 2
+
+# Chrome flags: the calendar is read from the DOM, so images are never needed
+BROWSER_ARGS = ["--blink-settings=imagesEnabled=false", "--disable-extensions"]
+
+# Requests dropped per tab via CDP: fonts, media and ad/analytics scripts. Stylesheets
+# stay, since the collector reads innerText, which depends on the computed layout.
+BLOCKED_URLS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp", "*.ico",
+                "*.woff", "*.woff2", "*.ttf", "*.mp4", "*.webm",
+                "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+                "*googlesyndication*", "*adservice*"]
+
+# --------------------
+# In-page JS snippets (built once, reused for every day/row)
+# --------------------
+# Collect every calendar row's cells plus the header time in one evaluate
+_JS_COLLECT_ROWS = r"""
+(() => {
+    const rows = Array.from(document.querySelectorAll('tr.calendar__row'));
+    // Extract header time for timezone detection
+    const headerTimeEl = document.querySelector('.calendar__header .calendar__time');
+    const headerTime = headerTimeEl ? headerTimeEl.innerText.trim() : '';
+
+    const rowsData = rows.map(r => {
+        const cls = r.className || '';
+        const q = sel => {
+            const el = r.querySelector(sel);
+            return el ? el.innerText.trim() : '';
+        };
+        const getSpanTitle = (sel) => {
+            const sp = r.querySelector(sel);
+            if (!sp) return '';
+            if (sp.getAttribute) {
+                return (sp.getAttribute('title') || sp.innerText || '').trim();
+            }
+            return (sp.innerText || '').trim();
+        };
+        return {
+            className: cls,
+            time: q('td.calendar__time'),
+            currency: q('td.calendar__currency'),
+            impact: getSpanTitle('td.calendar__impact span') || q('td.calendar__impact'),
+            event: q('td.calendar__event'),
+            actual: q('td.calendar__actual'),
+            forecast: q('td.calendar__forecast'),
+            previous: q('td.calendar__previous'),
+            hasDetail: !!r.querySelector('td.calendar__detail a')
+        };
+    });
+    return { rows: rowsData, headerTime: headerTime };
+})();
+"""
+
+# Resolve once the loaded calendar has rows (true) or after %(timeout_ms)d ms (false)
+_JS_WAIT_FOR_ROWS = r"""
+(async () => {
+    const deadline = Date.now() + %(timeout_ms)d;
+    while (Date.now() < deadline) {
+        if (document.readyState === 'complete' && document.querySelector('tr.calendar__row'))
+            return true;
+        await new Promise(r => setTimeout(r, 50));
+    }
+    return false;
+})();
+""" % {"timeout_ms": 5000}
+
+# Open, read and close the detail panel of each row in %(indexes)s (a JSON array of
+# tr.calendar__row indexes), one after another; returns {index: {name: value}}
+_JS_READ_DETAILS = r"""
+(async (indexes) => {
+    const sleep = ms => new Promise(r => setTimeout(r, ms));
+    const waitFor = async (fn, timeout) => {
+        const deadline = Date.now() + timeout;
+        while (Date.now() < deadline) {
+            const v = fn();
+            if (v) return v;
+            await sleep(25);
+        }
+        return null;
+    };
+    const rows = Array.from(document.querySelectorAll('tr.calendar__row'));
+    const out = {};
+    for (const i of indexes) {
+        const link = rows[i] && rows[i].querySelector('td.calendar__detail a');
+        if (!link) continue;
+        link.scrollIntoView();
+        link.click();
+        const table = await waitFor(() => document.querySelector(
+            'tr.calendar__details--detail table.calendarspecs'), 3000);
+        if (table) {
+            const specs = {};
+            Array.from(table.querySelectorAll('tr')).forEach(tr => {
+                const tds = tr.querySelectorAll('td');
+                if (tds.length >= 2) {
+                    const k = (tds[0].innerText || '').trim();
+                    const v = (tds[1].innerText || '').trim();
+                    if (k) specs[k] = v;
+                }
+            });
+            out[i] = specs;
+        }
+        const close = document.querySelector('a[title="Close Detail"]');
+        if (close) {
+            close.click();
+            // don't let the next row read this panel before it is gone
+            await waitFor(() => !document.querySelector('tr.calendar__details--detail'), 1000);
+        }
+    }
+    return out;
+})(%(indexes)s);
+"""
+
 # main -> incremental.scrape_incremental -> scrape_range_pandas -> scrape_day ->
 # parse_calendar_day
 # --------------------
@@ -17,29 +135,46 @@ logger = logging.getLogger(__name__)
 # --------------------
 
 def events_to_dataframe(events: list[CalendarEvent]) -> pd.DataFrame:
-    """Convert list of CalendarEvents to DataFrame."""
+    """Convert list of CalendarEvents to DataFrame, one column list per field."""
     if not events:
-        return pd.DataFrame(columns=["DateTime", "Currency", "Impact", "Event",
-                                     "Actual", "Forecast", "Previous", "Detail"])
-
-    data = []
-    for e in events:
-        data.append({
-            "DateTime": e.time.isoformat(),
-            "Currency": e.currency,  # Keep as Currency object
-            "Impact": e.impact.name if e.impact != Impact.UNKNOWN else "",
-            "Event": e.event,
-            "Actual": e.actual or "",
-            "Forecast": e.forecast or "",
-            "Previous": e.previous or "",
-            "Detail": e.detail or ""
-        })
-
-    return pd.DataFrame(data)
+        # Empty lists would give float64 columns, breaking later .str accessors
+        return pd.DataFrame(columns=CSV_COLUMNS)
+
+    unknown = Impact.UNKNOWN
+    # Many events share a time slot, so format each distinct datetime once. Aware
+    # datetimes compare by instant, so the offset is part of the key: 09:00+00:00
+    # and 10:00+01:00 are the same instant but must keep their own text.
+    keys = [(e.time, e.time.utcoffset()) for e in events]
+    iso = {key: key[0].isoformat() for key in set(keys)}
+    return pd.DataFrame({
+        "DateTime": [iso[key] for key in keys],
+        "Currency": [e.currency for e in events],  # Keep as Currency object
+        "Impact": [e.impact.name if e.impact != unknown else "" for e in events],
+        "Event": [e.event for e in events],
+        "Actual": [e.actual or "" for e in events],
+        "Forecast": [e.forecast or "" for e in events],
+        "Previous": [e.previous or "" for e in events],
+        "Detail": [e.detail or "" for e in events],
+    })
+
+
+def _days_to_scrape(days: list[datetime], existing_df: pd.DataFrame,
+                    today: date) -> list[datetime]:
+    """
+    Drop the days existing_df already has events for, keeping the refresh window
+    (REFRESH_RECENT_DAYS before today and everything after) so its values are updated.
+    """
+    covered_days = set(existing_df["DateTime"].str[:10])
+    refresh_from = today - timedelta(days=REFRESH_RECENT_DAYS)
+    return [d for d in days
+            if d.date() >= refresh_from or d.strftime('%Y-%m-%d') not in covered_days]
 
 
 async def scrape_range_pandas(from_date: datetime, to_date: datetime,
-    output_csv: str = None, scrape_details: bool = False) -> pd.DataFrame:
+    output_csv: str = None, scrape_details: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY, detail_cache: str = None,
+    profile_dir: str = None, skip_existing: bool = False,
+    browser: uc.Browser = None) -> pd.DataFrame:
     """
     Scrape ForexFactory calendar for date range and return DataFrame of CalendarEvents.
 
@@ -48,127 +183,249 @@ async def scrape_range_pandas(from_date: datetime, to_date: datetime,
         to_date: End date
         output_csv: Optional CSV file to save results
         scrape_details: Whether to scrape event details
+        concurrency: Number of browser tabs scraping days in parallel
+        detail_cache: Optional SQLite file persisting scraped details across runs
+        profile_dir: Optional Chrome profile directory, kept between runs so its
+            HTTP cache (FF's scripts and styles) stays warm; a fresh temporary
+            profile is used otherwise
+        skip_existing: Don't revisit days output_csv already has events for, except
+            those from REFRESH_RECENT_DAYS days ago onwards; ignored when scraping
+            details. Skipped days are left out of the returned DataFrame.
+        browser: Optional running nodriver browser to scrape in, e.g. shared by
+            several calls to skip Chrome's start-up; it is left running and only
+            the tabs opened here are closed. profile_dir is ignored then.
 
     Returns:
         DataFrame with columns: DateTime, Currency, Impact, Event, Actual, Forecast, Previous, Detail
         DateTime is timezone-aware in local time.
     """
+    # Without a CSV there is nothing to merge into or reuse details from
+    existing_df = None
     if output_csv:
         ensure_csv_header(output_csv)
         existing_df = read_existing_data(output_csv)
-    else:
-        existing_df = pd.DataFrame(columns=["DateTime", "Currency", "Impact", "Event",
-                                            "Actual", "Forecast", "Previous", "Detail"])
 
-    browser = await uc.start()
-    page = await browser.get('about:blank')
-
-    all_events: list[CalendarEvent] = []
     day_count = (to_date - from_date).days + 1
+    days = [from_date + timedelta(days=i) for i in range(day_count)]
+    if skip_existing and not scrape_details and existing_df is not None:
+        days = _days_to_scrape(days, existing_df, datetime.now().date())
+        if len(days) < day_count:
+            logger.info(f"Skipping {day_count - len(days)} days already in {output_csv}")
+            day_count = len(days)
+        if not days:
+            return events_to_dataframe([])
+
+    # Details already in the CSV (or the detail cache), looked up by key instead
+    # of scanning existing_df per row; filled once the browser is up
+    cache = None
+    existing_details: dict[tuple[str, str, str], str] = {}
+
+    events_by_day: dict[datetime, list[CalendarEvent]] = {}
+    # Day frames are merged into existing_df once at the end; meanwhile rows
+    # are told apart from those already on disk by their merge key
+    day_frames: list[pd.DataFrame] = []
+    csv_keys = (set(zip(*(existing_df[col].astype(str).str.strip() for col in MERGE_KEY)))
+                if existing_df is not None else set())
     logger.info(f"Scraping from {from_date.date()} to {to_date.date()} for {day_count} days.")
 
-    try:
-        current_day = from_date
-        while current_day <= to_date:
-            events = await scrape_day(page, current_day, existing_df,
-                                      scrape_details=scrape_details)
-
-            if events:
-                all_events.extend(events)
-                df_new = events_to_dataframe(events)
+    own_browser = browser is None
+    if own_browser:
+        # nodriver only deletes the profiles it creates itself, so a given dir persists
+        browser = await uc.start(user_data_dir=profile_dir, browser_args=BROWSER_ARGS)
 
-                if output_csv:
-                    merged_df = merge_new_data(existing_df, df_new)
-                    new_rows = len(merged_df) - len(existing_df)
-                    if new_rows > 0:
-                        logger.info(f"Added/Updated {new_rows} rows for {current_day.date()}")
-                    existing_df = merged_df
-                    write_data_to_csv(existing_df, output_csv)
+    # Each worker owns one tab and pulls the next day from the shared iterator,
+    # so the tab count bounds concurrency without a separate semaphore. The CSV
+    # bookkeeping has no await in it, so workers never interleave there.
+    day_iter = iter(days)
 
-            current_day += timedelta(days=1)
+    async def _scrape_days(page):
+        for current_day in day_iter:
+            try:
+                events = await scrape_day(page, current_day, existing_details,
+                                          scrape_details=scrape_details)
+            except Exception as e:
+                # One bad day (e.g. a failed navigation) must not take down the
+                # worker, or its share of the remaining days would go unscraped
+                logger.warning(f"Failed to scrape {current_day.date()}: {e}", exc_info=True)
+                continue
+            events_by_day[current_day] = events
+
+            if cache:
+                fresh = {}
+                for e in events:
+                    if e.detail:
+                        key = (e.time.isoformat(), str(e.currency), e.event)
+                        if key not in existing_details:
+                            fresh[key] = e.detail
+                cache.store(fresh)
+                existing_details.update(fresh)
+
+            if events and output_csv:
+                # Day frames are only needed for the CSV; the returned frame is
+                # built once from all events below.
+                df_new = events_to_dataframe(events)
+                day_frames.append(df_new)
+                keys = list(zip(df_new["DateTime"], df_new["Currency"].astype(str),
+                                df_new["Event"]))
+                is_new = [key not in csv_keys for key in keys]
+                csv_keys.update(keys)
+                if any(is_new):
+                    logger.info(f"Added {sum(is_new)} rows for {current_day.date()}")
+                    # Put just the new rows on disk now so a killed run keeps them
+                    append_data_to_csv(df_new[is_new], output_csv)
+
+    pages = []
+    failed = True
+    try:
+        # Opened inside the try, so a bad detail_cache path still stops the browser
+        if scrape_details and detail_cache:
+            cache = DetailCache(detail_cache)
+            existing_details.update(cache.load())
+        if scrape_details and existing_df is not None:
+            existing_details.update(build_detail_index(existing_df))
+
+        # A caller's browser keeps its own tabs; ours starts with a blank one to reuse
+        pages.append(await browser.get('about:blank', new_tab=not own_browser))
+        for _ in range(1, max(1, min(concurrency, day_count))):
+            pages.append(await browser.get('about:blank', new_tab=True))
+        for page in pages:
+            await _block_resources(page)
+
+        workers = [asyncio.create_task(_scrape_days(page)) for page in pages]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+        failed = False
     finally:
-        if browser:
-            async def _try_call_shutdown(obj):
-                # Try a list of common shutdown/close method names used by various drivers
-                for name in ("close", "quit", "stop", "shutdown", "disconnect"):
-                    func = getattr(obj, name, None)
-                    if not func:
-                        continue
+        # Release Chrome and the cache first, so a failing CSV write can't leak them
+        try:
+            if cache:
+                cache.close()
+        finally:
+            if own_browser:
+                try:
+                    browser.stop()  # nodriver: schedules aclose() and terminates Chrome
+                except Exception as e:
+                    logger.error(f"Error closing nodriver: {e}")
+                finally:
+                    browser = None
+            else:
+                for page in pages:
                     try:
-                        res = func()
-                        # If the call returned a coroutine, await it
-                        if asyncio.iscoroutine(res):
-                            await res
-                        logger.info(f"[nodriver] {name} called successfully.")
-                        return
-                    except Exception as exc:
-                        logger.warning(f"Attempt to call nodriver.{name}() \
-                                       raised: {exc}")
-                logger.warning(
-                "No supported shutdown method succeeded 4 WebDriver instance.")
+                        await page.close()
+                    except Exception as e:
+                        logger.error(f"Error closing tab: {e}")
 
+        # New rows were appended day by day; merge and rewrite the CSV once for
+        # the whole range to sort it and pick up values rescraped for existing rows.
+        if day_frames:
             try:
-                await _try_call_shutdown(browser)
-            except Exception as e:
-                logger.error(f"Error closing nodriver: {e}")
-            finally:
-                browser = None
+                write_data_to_csv(merge_new_data(existing_df,
+                    pd.concat(day_frames, ignore_index=True)), output_csv)
+            except Exception:
+                if not failed:
+                    raise
+                # The new rows are already on disk; don't mask the scrape error
+                logger.error(f"Could not rewrite {output_csv}", exc_info=True)
 
+    all_events = [e for day in days for e in events_by_day.get(day, [])]
     logger.info(f"Done. Total events scraped: {len(all_events)}")
 
     # Return DataFrame of all events
     return events_to_dataframe(all_events)
 
 
-async def scrape_day(page, the_date: datetime, existing_df: pd.DataFrame,
-                     scrape_details=False) -> list[CalendarEvent]:
+async def _block_resources(page: uc.Tab) -> None:
     """
-    Scrape a single day, returning list of CalendarEvents.
+    Stop the tab from downloading BLOCKED_URLS; set once per tab, kept across navigations.
+    """
+    try:
+        await page.send(uc.cdp.network.enable())
+        await page.send(uc.cdp.network.set_blocked_ur_ls(urls=BLOCKED_URLS))
+    except Exception as e:
+        # Only an optimization; scrape with full page loads rather than fail
+        logger.warning(f"Could not block resources: {e}")
+
+
+async def _evaluate_value(page: uc.Tab, expression: str, await_promise: bool = False):
     """
-    events = await parse_calendar_day(page, the_date,
-        scrape_details=scrape_details, existing_df=existing_df)
+    Evaluate expression in the page and return its result as a plain JSON value.
 
-    # Handle case where parse_calendar_day returns empty DataFrame on error
-    if isinstance(events, pd.DataFrame):
-        return []
+    Tab.evaluate always sends deep serializationOptions, which per CDP take precedence
+    over returnByValue, so its return_by_value=True still hands back a RemoteObject.
+    Runtime.evaluate is sent directly instead, without serialization options.
+    """
+    remote_object, errors = await page.send(uc.cdp.runtime.evaluate(
+        expression=expression, await_promise=await_promise,
+        return_by_value=True, user_gesture=True))
+    if errors:
+        detail = errors.exception.description if errors.exception else errors.text
+        raise RuntimeError(f"Script failed: {detail}")
+    return remote_object.value
 
-    return events
+
+async def scrape_day(page, the_date: datetime, existing_details: dict,
+                     scrape_details=False) -> list[CalendarEvent]:
+    """
+    Scrape a single day, returning list of CalendarEvents.
+    """
+    return await parse_calendar_day(page, the_date,
+        scrape_details=scrape_details, existing_details=existing_details)
 
 # --------------------
 # Main day parser
 # --------------------
 async def parse_calendar_day(page, the_date: datetime,
-            scrape_details=False, existing_df=None) -> pd.DataFrame:
+            scrape_details=False, existing_details=None) -> list[CalendarEvent]:
     """
-    Scrape data for a single day (the_date) and return a DataFrame with columns:
-      DateTime, Currency, Impact, Event, Actual, Forecast, Previous, Detail
+    Scrape data for a single day (the_date) and return its CalendarEvents
+    (empty if the calendar could not be read).
 
-    This function first tries to use nodriver's select/select_all. If those raise a DOM/Protocol
-    exception (e.g. '-32000'), it falls back to running JS via page.evaluate(...) to
-    collect the visible rows as a serializable list of dicts. Detail scraping (if requested)
-    is handled via evaluate as well (click via JS, then extract the detail table).
+    All visible rows are collected in a single Runtime.evaluate call as a serializable
+    list of dicts, rather than one CDP round-trip per cell. On a DOM/Protocol exception
+    (e.g. '-32000') the page is reloaded and collection retried. Detail scraping (if
+    requested) is handled via evaluate as well (click via JS, then extract the detail table).
     """
-    date_str = the_date.strftime('%b%d.%Y').lower()
-    url = f"https://www.forexfactory.com/calendar?day={date_str}"
+    url = f"https://www.forexfactory.com/calendar?{build_url_for_day(the_date)}"
     logger.debug(f"Scraping {url}")
     await page.get(url)
 
-    # Wait for page to load and JS to populate calendar
-    await asyncio.sleep(2.0)
+    # Wait for page to load and JS to populate calendar: polled in-page, so a fast
+    # load isn't held up by a fixed sleep (a timeout falls through to the retries)
+    try:
+        await _evaluate_value(page, _JS_WAIT_FOR_ROWS, await_promise=True)
+    except Exception:
+        logger.debug("Waiting for calendar rows failed", exc_info=True)
 
-    # ---- helper: robust wait for calendar table (tries select, then fallback evaluate)
+    # ---- helper: robust wait for calendar rows, collected in one evaluate
     async def _wait_for_calendar_table_and_get_rows(page, url, max_attempts=3):
-                # xpath='//table[contains(@class,"calendar__table")]'):
         last_exc = None
         for attempt in range(1, max_attempts + 1):
-            try: # normal fast path first
-                if attempt > 1:
-                    await asyncio.sleep(min(0.5 * (2 ** (attempt - 2)), 2.0))
-                # this may raise ProtocolException if CDP dom query fails
-                nodes = await page.select_all('//tr[contains(@class,"calendar__row")]')                
-                if not nodes: # normalize: some drivers return None
-                    nodes = []
-                return {"mode": "elements", "nodes": nodes}
+            if attempt > 1:
+                await asyncio.sleep(min(0.5 * (2 ** (attempt - 2)), 2.0))
+            try:
+                # Plain {"rows": [...], "headerTime": ...} instead of nodriver's
+                # deep-serialized [[key, {type, value}], ...] pairs
+                result = await _evaluate_value(page, _JS_COLLECT_ROWS)
+                if logger.isEnabledFor(logging.DEBUG):
+                    # str() of the whole day's payload is costly; only build it when logged
+                    logger.debug("JS evaluate result type: %s, first 200 chars: %s",
+                                 type(result), str(result)[:200])
+
+                if not isinstance(result, dict):
+                    raise RuntimeError(f"Row collection returned {result!r}")
+                rows_data = result.get("rows") or []
+                header_time = result.get("headerTime") or ""
+
+                logger.debug(f"Header time from FF: {header_time}, rows count: {len(rows_data) if isinstance(rows_data, list) else 'N/A'}")
+
+                # if JS returned rows, use it
+                if isinstance(rows_data, list) and len(rows_data) > 0:
+                    return {"rows_data": rows_data, "header_time": header_time}
+                logger.warning("Waiting for calendar rows attempt %d/%d: none found yet",
+                               attempt, max_attempts)
             except Exception as exc:
                 last_exc = exc
                 msg = str(exc)
@@ -185,90 +442,10 @@ async def parse_calendar_day(page, the_date: datetime,
                                 await res
                         else:
                             await page.get(url)
-                        logger.info("Tried page.reload()/re-get after DOM error.")                        
+                        logger.info("Tried page.reload()/re-get after DOM error.")
                         await asyncio.sleep(0.5) # small pause after reload
                     except Exception:
                         logger.debug("reload/get attempt failed",exc_info=True)
-                # Next: try the JS fallback to directly pull row data from the page's runtime
-                try:
-                    js = r"""
-                    (() => {
-                        const rows = Array.from(document.querySelectorAll('tr.calendar__row'));
-                        // Extract header time for timezone detection
-                        const headerTimeEl = document.querySelector('.calendar__header .calendar__time');
-                        const headerTime = headerTimeEl ? headerTimeEl.innerText.trim() : '';
-
-                        const rowsData = rows.map(r => {
-                            const cls = r.className || '';
-                            const q = sel => {
-                                const el = r.querySelector(sel);
-                                return el ? el.innerText.trim() : '';
-                            };
-                            const getSpanTitle = (sel) => {
-                                const sp = r.querySelector(sel);
-                                if (!sp) return '';
-                                if (sp.getAttribute) {
-                                    return sp.getAttribute('title') || (sp.innerText || '').trim();
-                                }
-                                return (sp.innerText || '').trim();
-                            };
-                            return {
-                                className: cls,
-                                time: q('td.calendar__time'),
-                                currency: q('td.calendar__currency'),
-                                impact: getSpanTitle('td.calendar__impact span') || q('td.calendar__impact'),
-                                event: q('td.calendar__event'),
-                                actual: q('td.calendar__actual'),
-                                forecast: q('td.calendar__forecast'),
-                                previous: q('td.calendar__previous'),
-                                hasDetail: !!r.querySelector('td.calendar__detail a')
-                            };
-                        });
-                        return { rows: rowsData, headerTime: headerTime };
-                    })();
-                    """
-                    result = await page.evaluate(js)
-                    logger.debug(f"JS evaluate result type: {type(result)}, first 200 chars: {str(result)[:200]}")
-
-                    # Handle nested format from nodriver
-                    # nodriver returns JS objects as lists of [key, value] pairs
-                    rows_data = []
-                    header_time = ""
-
-                    if isinstance(result, list) and result and isinstance(result[0], list):
-                        # Format: [['rows', {...}], ['headerTime', {...}]]
-                        result_dict = {k: v for k, v in result}
-                        rows_obj = result_dict.get("rows", {})
-                        header_obj = result_dict.get("headerTime", {})
-
-                        # Extract rows array
-                        if isinstance(rows_obj, dict) and rows_obj.get("type") == "array":
-                            rows_data = rows_obj.get("value", [])
-                        elif isinstance(rows_obj, list):
-                            rows_data = rows_obj
-
-                        # Extract header time
-                        if isinstance(header_obj, dict) and "value" in header_obj:
-                            header_time = header_obj.get("value", "")
-                        elif isinstance(header_obj, str):
-                            header_time = header_obj
-                    elif isinstance(result, dict):
-                        rows_data = result.get("rows", [])
-                        header_time = result.get("headerTime", "")
-
-                    logger.debug(f"Header time from FF: {header_time}, rows count: {len(rows_data) if isinstance(rows_data, list) else 'N/A'}")
-
-                    # if JS returned rows, use it
-                    if isinstance(rows_data, list) and len(rows_data) > 0:
-                        return {"mode": "js", "rows_data": rows_data, "header_time": header_time}
-                    else:
-                        logger.debug("JS did not return row list.")
-                except Exception as e2:
-                    logger.debug("JS fallback evaluate attempt %d failed: %s",
-                                 attempt, e2, exc_info=True)
-
-                # continue retry loop
-                continue
 
         # if we got here, nothing succeeded. attempt to dump the page HTML to disk for debugging
         try:
@@ -305,340 +482,55 @@ async def parse_calendar_day(page, the_date: datetime,
         rows_result = await _wait_for_calendar_table_and_get_rows(page, url)
     except Exception as e:
         logger.warning(f"Extraction did not work for {the_date.date()}: {e}", exc_info=True)
-        return pd.DataFrame(columns=["DateTime", "Currency", "Impact", "Event",
-            "Actual", "Forecast", "Previous", "Detail"])
+        return []
 
     # ----------------------------------------------------
-    # Extract data using the appropriate mode
+    # Extract data from the collected rows
     # ----------------------------------------------------
     current_day = the_date
     header_time = rows_result.get("header_time", "")
-    logger.debug("Found %d rows for %s using mode %s",
-        len(rows_result.get("nodes", []))
-        if "nodes" in rows_result else len(rows_result.get("rows_data", [])),
-        the_date.date(),
-        rows_result["mode"])
-
-    if rows_result["mode"] == "elements":
-        events = await extract_via_elements(rows_result["nodes"],
-            current_day, scrape_details, existing_df, page, header_time)
-    else: # JS mode
-        events = await extract_via_javascript(rows_result["rows_data"],
-            current_day, scrape_details, existing_df, page, header_time)
-
-    return events
-
-# --------------------
-# Helper utilities
-# --------------------
-async def _normalize_element(el):
-    """If selector returns a list-like, return the first element. If None, return None."""
-    if el is None:
-        return None
-    # many drivers return lists for select_all/select; normalize:
-    try:
-        # duck-type: lists/tuples
-        if isinstance(el, (list, tuple)) and len(el) > 0:
-            return el[0]
-    except Exception:
-        pass
-    return el
-
-async def safe_select(element, xpath, timeout=None):
-    """Safe wrapper for element.select() that returns a single normalized element or None."""
-    try:
-        node = await element.select(xpath, timeout=timeout)  # driver-specific API
-        return await _normalize_element(node)
-    except Exception:
-        return None
-
-async def safe_select_all(element, xpath):
-    """Safe wrapper for element.select_all() that returns list (maybe empty)."""
-    try:
-        nodes = await element.select_all(xpath)
-        if nodes is None:
-            return []
-        return nodes
-    except Exception:
-        return []
+    logger.debug("Found %d rows for %s",
+        len(rows_result["rows_data"]), the_date.date())
 
-async def safe_text(element):
-    """Return stripped text or empty string. Accepts element or list."""
-    try:
-        if element is None:
-            return ""
-        el = await _normalize_element(element)
-        txt = await el.get_text()
-        return txt.strip() if txt else ""
-    except Exception:
-        return ""
-
-async def safe_attribute(element, attr_name):
-    """Return attribute value or empty string. Accepts element or list."""
-    try:
-        if element is None:
-            return ""
-        el = await _normalize_element(element)
-        val = await el.get_attribute(attr_name)
-        return val or ""
-    except Exception:
-        return ""
+    events = await extract_via_javascript(rows_result["rows_data"],
+        current_day, scrape_details, existing_details, page, header_time)
 
+    return events
 
 # --------------------
 # Detail parsing
 # --------------------
-async def parse_detail_table(detail_element):
+def _detail_data_to_string(detail_data: dict) -> str:
     """
-    Parses the detail table from a nodriver element.
-    Returns a dictionary of specs.
+    Convert a {spec name: value} detail dictionary into a single string for CSV storage.
+    Replace newlines or excessive whitespaces with space.
     """
-    detail_data = {}
-    try:
-        detail_element = await _normalize_element(detail_element)
-        if not detail_element:
-            return detail_data
-
-        detail_table = await safe_select(detail_element, './/table[@class="calendarspecs"]')
-        if not detail_table:
-            return detail_data
+    return " | ".join(f"{' '.join(k.split())}: {' '.join(v.split())}"
+                      for k, v in detail_data.items())
 
-        rows = await safe_select_all(detail_table, './tr')
-        for r in rows:
-            try:
-                spec_name_el = await safe_select(r, './td[1]')
-                spec_desc_el = await safe_select(r, './td[2]')
-                spec_name = await safe_text(spec_name_el)
-                spec_desc = await safe_text(spec_desc_el)
-                if spec_name:
-                    detail_data[spec_name.strip()] = spec_desc.strip()
-            except Exception:
-                logger.debug("Ignored one detail row due to parse issue", exc_info=True)
-                continue
-    except Exception as e:
-        logger.error("Error parsing detail table: %s", e, exc_info=True)
-    return detail_data
-
-async def parse_event_details(page, row_or_index, event_dt: datetime, currency_text: str, 
-                            event_text: str, existing_df, mode: str = "elements") -> str:
+async def scrape_event_details(page, row_indexes: list[int]) -> dict[int, str]:
     """
-    Extract event details for a given row.
-    
+    Open, read and close the detail panel of each given row in a single in-page
+    loop, i.e. one CDP round-trip for the whole day instead of three per row.
+
     Args:
         page: Browser page object
-        row_or_index: Either a row element (elements mode) or row index (js mode)
-        event_dt: Event datetime
-        currency_text: Currency code
-        event_text: Event name
-        existing_df: DataFrame of existing data to check for cached details
-        mode: "elements" or "js"
-    
+        row_indexes: Indexes into the page's tr.calendar__row list
+
     Returns:
-        Detail string or empty string if no details found
+        Dict of row index to detail string, for rows whose details were found
     """
-
-    def _detail_data_to_string(detail_data: dict) -> str:
-        """
-        Convert dictionary from parse_detail_table() into a single string for CSV storage.
-        Replace newlines or excessive whitespaces with space.
-        """
-        parts = []
-        for k, v in detail_data.items():
-            k_clean = re.sub(r'\s+', ' ', k).strip()
-            v_clean = re.sub(r'\s+', ' ', v).strip()
-            parts.append(f"{k_clean}: {v_clean}")
-        return " | ".join(parts)
-
-    detail_str = ""
-    
     try:
-        # Check existing_df first to avoid re-scraping
-        if existing_df is not None:
-            matched = existing_df[
-                (existing_df["DateTime"] == event_dt.isoformat()) &
-                (existing_df["Currency"].str.strip() == currency_text) &
-                (existing_df["Event"].str.strip() == event_text)
-            ]
-            if not matched.empty:
-                existing_detail = str(matched.iloc[0]["Detail"]).strip() if pd.notnull(matched.iloc[0]["Detail"]) else ""
-                if existing_detail:
-                    return existing_detail
-
-        if mode == "elements":
-            # Element-based detail extraction
-            open_link = await row_or_index.select('.//td[contains(@class,"calendar__detail")]/a')
-            if open_link:
-                try:
-                    await open_link.scroll_into_view()
-                except Exception:
-                    pass
-                await asyncio.sleep(0.25)
-                try:
-                    await open_link.click()
-                except Exception:
-                    logger.debug("click() on detail link failed (elements path)", exc_info=True)
-
-                # Extract detail via element selector
-                try:
-                    detail_element = await page.select('//tr[contains(@class,"calendar__details--detail")]', timeout=3)
-                    detail_data = await parse_detail_table(detail_element)
-                    detail_str = _detail_data_to_string(detail_data)
-                except Exception:
-                    logger.debug("Couldn't read detail element after click (elements path)", exc_info=True)
-
-                # Close detail panel
-                try:
-                    close_link = await page.select('.//a[@title="Close Detail"]')
-                    close_link = await _normalize_element(close_link)
-                    if close_link:
-                        try:
-                            await close_link.click()
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
-
-        elif mode == "js":
-            # JavaScript-based detail extraction
-            idx = row_or_index  # In JS mode, this is the row index
-            js_click = f"""
-            (() => {{
-                const rows = Array.from(document.querySelectorAll('tr.calendar__row'));
-                if (!rows || rows.length <= {idx}) return false;
-                const link = rows[{idx}].querySelector('td.calendar__detail a');
-                if (!link) return false;
-                link.scrollIntoView();
-                link.click();
-                return true;
-            }})();
-            """
-            try:
-                clicked = await page.evaluate(js_click)
-                if clicked:
-                    # Wait for detail row to appear
-                    await asyncio.sleep(0.45)
-                    js_detail = r"""
-                    (() => {
-                        const out = {};
-                        const detailRow = document.querySelector('tr.calendar__details--detail');
-                        if (!detailRow) return null;
-                        const table = detailRow.querySelector('table.calendarspecs');
-                        if (!table) return null;
-                        Array.from(table.querySelectorAll('tr')).forEach(tr => {
-                            const tds = tr.querySelectorAll('td');
-                            if (tds.length >= 2) {
-                                const k = (tds[0].innerText || '').trim();
-                                const v = (tds[1].innerText || '').trim();
-                                if (k) out[k] = v;
-                            }
-                        });
-                        return out;
-                    })();
-                    """
-                    detail_data = await page.evaluate(js_detail)
-                    if isinstance(detail_data, dict):
-                        detail_str = _detail_data_to_string(detail_data)
-                    # Close detail panel
-                    try:
-                        await page.evaluate("""() => { const c = document.querySelector('a[title="Close Detail"]'); if (c){ c.click(); return true } return false }""")
-                    except Exception:
-                        pass
-            except Exception:
-                logger.debug("JS detail click/extract failed for idx %d", idx, exc_info=True)
-
+        result = await _evaluate_value(page,
+            _JS_READ_DETAILS % {"indexes": json.dumps(row_indexes)}, await_promise=True)
     except Exception:
-        logger.debug(f"Detail extraction error ({mode} path)", exc_info=True)
-    
-    return detail_str
-
-async def extract_via_elements(rows, current_day: datetime, scrape_details: bool,
-                             existing_df, page, header_time: str = "") -> list:
-    """
-    Extract calendar data using nodriver element handles.
-    
-    Args:
-        rows: List of row elements
-        current_day: Base date for the calendar day
-        scrape_details: Whether to extract event details
-        existing_df: DataFrame of existing data
-        page: Browser page object
-    
-    Returns:
-        List of event dictionaries
-    """
-    logger.debug("Extracting rows using element handles")
-    data_list = []
-    
-    for row in rows:
-        logger.debug('Processing row element')
-        logger.debug(row)
-
-        try:
-            row_class = await row.get_attribute("class") or ""
-        except Exception:
-            logger.warning("Error reading row HTML or class", exc_info=True)
-            row_class = ""
-        
-        if "day-breaker" in row_class or "no-event" in row_class:
-            continue
-
-        # Extract cell elements
-        try:
-            time_el = await row.select('.//td[contains(@class,"calendar__time")]')
-            currency_el = await row.select('.//td[contains(@class,"calendar__currency")]')
-            impact_el = await row.select('.//td[contains(@class,"calendar__impact")]')
-            event_el = await row.select('.//td[contains(@class,"calendar__event")]')
-            actual_el = await row.select('.//td[contains(@class,"calendar__actual")]')
-            forecast_el = await row.select('.//td[contains(@class,"calendar__forecast")]')
-            previous_el = await row.select('.//td[contains(@class,"calendar__previous")]')
-        except Exception as e:
-            logger.warning("Error reading row cells", exc_info=True)
-            continue
-
-        # Extract text from elements
-        time_text = (await (time_el.get_text() if time_el else "")).strip() if time_el else ""
-        currency_text = (await (currency_el.get_text() if currency_el else "")).strip() if currency_el else ""
-        event_text = (await (event_el.get_text() if event_el else "")).strip() if event_el else ""
-        actual_text = (await (actual_el.get_text() if actual_el else "")).strip() if actual_el else ""
-        forecast_text = (await (forecast_el.get_text() if forecast_el else "")).strip() if forecast_el else ""
-        previous_text = (await (previous_el.get_text() if previous_el else "")).strip() if previous_el else ""
-
-        # Extract impact text (with special handling for span title)
-        impact_text = ""
-        try:
-            impact_span = await (impact_el.select('.//span') if impact_el else None)
-            if impact_span:
-                impact_text = (await impact_span.get_attribute("title")) or ""
-            if not impact_text and impact_el:
-                impact_text = (await impact_el.get_text()).strip()
-        except Exception as e:
-            logger.warning("Error reading impact cell", exc_info=True)
-            impact_text = (await (impact_el.get_text() if impact_el else "")).strip() if impact_el else ""
-
-        # Parse time to datetime
-        event_dt = parse_time_to_datetime(time_text, current_day)
-
-        # Extract details if requested
-        detail_str = ""
-        if scrape_details:
-            detail_str = await parse_event_details(
-                page, row, event_dt, currency_text, event_text, 
-                existing_df, mode="elements"
-            )
-
-        data_list.append({
-            "DateTime": event_dt.isoformat(),
-            "Currency": currency_text,
-            "Impact": impact_text,
-            "Event": event_text,
-            "Actual": actual_text,
-            "Forecast": forecast_text,
-            "Previous": previous_text,
-            "Detail": detail_str
-        })
-    
-    return data_list
-
+        logger.debug("Batched detail extraction failed for rows %s", row_indexes, exc_info=True)
+        return {}
+    if not isinstance(result, dict):
+        logger.debug("Batched detail extraction returned %r", result)
+        return {}
+    return {int(i): _detail_data_to_string(specs)
+            for i, specs in result.items() if isinstance(specs, dict)}
 
 def _detect_timezone_offset(header_time: str) -> timezone:
     """
@@ -657,20 +549,12 @@ def _detect_timezone_offset(header_time: str) -> timezone:
 
     # Parse the header time
     now = datetime.now()
-    m = re.search(r'(\d{1,2}):(\d{2})\s*(am|pm)?', header_time.lower())
-    if not m:
+    hhmm = parse_hhmm(header_time.lower())
+    if not hhmm:
         local_offset = now.astimezone().utcoffset()
         return timezone(local_offset)
 
-    hh = int(m.group(1))
-    mm = int(m.group(2))
-    ampm = m.group(3)
-
-    if ampm:
-        if ampm == 'pm' and hh < 12:
-            hh += 12
-        if ampm == 'am' and hh == 12:
-            hh = 0
+    hh, mm = hhmm
 
     # Create FF time for today
     ff_time = now.replace(hour=hh, minute=mm, second=0, microsecond=0)
@@ -696,7 +580,7 @@ def _detect_timezone_offset(header_time: str) -> timezone:
 
 
 async def extract_via_javascript(rows_data, current_day: datetime, scrape_details: bool,
-                                existing_df, page, header_time: str = "") -> list[CalendarEvent]:
+                                existing_details, page, header_time: str = "") -> list[CalendarEvent]:
     """
     Extract calendar data using JavaScript evaluation results.
 
@@ -704,7 +588,7 @@ async def extract_via_javascript(rows_data, current_day: datetime, scrape_detail
         rows_data: List of dictionaries from JavaScript evaluation
         current_day: Base date for the calendar day
         scrape_details: Whether to extract event details
-        existing_df: DataFrame of existing data
+        existing_details: (DateTime, Currency, Event) -> Detail index of cached details
         page: Browser page object
         header_time: Time from FF header for timezone detection
 
@@ -717,82 +601,85 @@ async def extract_via_javascript(rows_data, current_day: datetime, scrape_detail
     # Detect timezone from header
     tz = _detect_timezone_offset(header_time)
     logger.debug(f"Using timezone: {tz}")
-
-    def _convert_js_result(obj):
-        """Convert nodriver's nested JS result format to flat dict."""
-        if isinstance(obj, dict):
-            if obj.get("type") == "object" and "value" in obj:
-                # Convert [['key', {'type': 'string', 'value': 'val'}], ...] to {'key': 'val'}
-                return {k: _convert_js_result(v) for k, v in obj["value"]}
-            elif "type" in obj and "value" in obj:
-                return obj["value"]
-            else:
-                return {k: _convert_js_result(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [_convert_js_result(item) for item in obj]
-        return obj
+    # Attach tz to the day once; parse_time_to_datetime keeps base_date's tzinfo,
+    # so its memoized results (incl. All Day/Day N/Data) are reused as-is per row.
+    day_base = current_day.replace(tzinfo=tz)
 
     last_time_text = ""  # Track last seen time for inherited times
+    pending_details: dict[int, int] = {}  # row index -> position in events
 
-    for idx, raw_rdict in enumerate(rows_data):
-        logger.debug("JS mode row %d data: %s", idx, raw_rdict)
+    log_rows = logger.isEnabledFor(logging.DEBUG)
+    # local aliases avoid a global lookup per row
+    _parse_time, _norm = parse_time_to_datetime, normalize_impact
+    _cur = currency_for_symbol
+    _Event, _append = CalendarEvent, events.append
 
-        # Convert nested format to flat dict
-        rdict = _convert_js_result(raw_rdict)
+    for idx, rdict in enumerate(rows_data):
+        if log_rows:
+            logger.debug("JS mode row %d data: %s", idx, rdict)
 
-        row_class = rdict.get("className", "") or ""
+        get = rdict.get
+        row_class = get("className") or ""
         if "day-breaker" in row_class or "no-event" in row_class:
             continue
 
-        # Extract text fields from dictionary
-        time_text = (rdict.get("time") or "").strip()
-        currency_text = (rdict.get("currency") or "").strip()
-        event_text = (rdict.get("event") or "").strip()
-        actual_text = (rdict.get("actual") or "").strip()
-        forecast_text = (rdict.get("forecast") or "").strip()
-        previous_text = (rdict.get("previous") or "").strip()
-        impact_text = (rdict.get("impact") or "").strip()
-
         # Skip rows without event name
+        event_text = get("event") or ""
         if not event_text:
             continue
 
+        # Extract text fields from dictionary (already trimmed by the JS collector)
+        time_text = get("time") or ""
+        currency_text = get("currency") or ""
+        actual_text = get("actual") or ""
+        forecast_text = get("forecast") or ""
+        previous_text = get("previous") or ""
+        impact_text = get("impact") or ""
+
         # Inherit time from previous event if empty or tentative
         if time_text and time_text.lower() != "tentative":
             last_time_text = time_text
         elif last_time_text:
             time_text = last_time_text
 
-        # Parse time to datetime and make timezone-aware
-        event_dt = parse_time_to_datetime(time_text, current_day)
-        event_dt = event_dt.replace(tzinfo=tz)
-
-        # Extract details if requested and available
-        detail_str = ""
-        if scrape_details and rdict.get("hasDetail", False):
-            detail_str = await parse_event_details(
-                page, idx, event_dt, currency_text, event_text,
-                existing_df, mode="js"
-            )
+        # Parse time to a timezone-aware datetime
+        event_dt = _parse_time(time_text, day_base)
 
-        # Create Currency object
+        # Shared Currency per symbol (rows repeat a handful of symbols)
         try:
-            currency = Currency(symbol=currency_text) if currency_text else Currency(symbol="UNK")
+            currency = _cur(currency_text or "UNK")
         except Exception:
-            currency = Currency(symbol="EXC")
+            currency = _cur("EXC")
+
+        # Reuse details already in the CSV; rows needing a fresh detail are
+        # collected and scraped in one batch after the loop. The key uses
+        # str(currency), as the CSV and the detail cache do.
+        detail_str = ""
+        if scrape_details and get("hasDetail"):
+            if existing_details:
+                detail_str = existing_details.get(
+                    (event_dt.isoformat(), str(currency), event_text), "")
+            if not detail_str:
+                pending_details[idx] = len(events)
 
         # Create CalendarEvent
-        event = CalendarEvent(
+        event = _Event(
             time=event_dt,
             currency=currency,
-            impact=normalize_impact(impact_text),
+            impact=_norm(impact_text),
             event=event_text,
             actual=actual_text or None,
             forecast=forecast_text or None,
             previous=previous_text or None,
             detail=detail_str or None
         )
-        events.append(event)
+        _append(event)
+
+    if pending_details:
+        details = await scrape_event_details(page, list(pending_details))
+        for idx, detail_str in details.items():
+            if detail_str and idx in pending_details:
+                events[pending_details[idx]].detail = detail_str
 
     return events
 
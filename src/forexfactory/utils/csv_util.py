@@ -12,6 +12,12 @@ logger = logging.getLogger(__name__)
 # Define the CSV columns
 CSV_COLUMNS = ["DateTime", "Currency", "Impact", "Event", "Actual", "Forecast", "Previous", "Detail"]
 
+# Columns identifying one calendar event when merging
+MERGE_KEY = ["DateTime", "Currency", "Event"]
+
+# Columns a rescrape may revise (pending actuals, updated forecasts)
+VALUE_COLUMNS = ["Actual", "Forecast", "Previous"]
+
 def ensure_csv_header(csv_file):
     """
     Ensure that the CSV file exists with the proper header.
@@ -27,7 +33,9 @@ def read_existing_data(csv_file):
     """
     if os.path.exists(csv_file):
         try:
-            df = pd.read_csv(csv_file, dtype=str)
+            # Every column is text and empty cells mean "no value", so skip
+            # pandas' NA detection (na_filter=False) and keep them as "".
+            df = pd.read_csv(csv_file, dtype=str, na_filter=False)
             # Ensure all columns exist in the DataFrame
             for col in CSV_COLUMNS:
                 if col not in df.columns:
@@ -48,6 +56,41 @@ def write_data_to_csv(df: pd.DataFrame, csv_file: str):
     df.to_csv(csv_file, index=False)
 
 
+def append_data_to_csv(df: pd.DataFrame, csv_file: str):
+    """
+    Append rows to an existing CSV (header already written), without rereading it.
+
+    A file whose header isn't CSV_COLUMNS (e.g. a legacy CSV without 'Detail') is
+    rewritten with every column first, as appended rows would not fit its header.
+    """
+    if df.empty:
+        return
+    with open(csv_file, newline="") as fh:
+        header = next(csv.reader(fh), [])
+    if header != CSV_COLUMNS:
+        df = pd.concat([read_existing_data(csv_file), df[CSV_COLUMNS]], ignore_index=True)
+        df.to_csv(csv_file, index=False)
+        return
+    df[CSV_COLUMNS].to_csv(csv_file, mode="a", header=False, index=False)
+
+
+def build_detail_index(df: pd.DataFrame) -> dict[tuple[str, str, str], str]:
+    """
+    Map (DateTime, Currency, Event) to the non-empty 'Detail' of each row in df,
+    so detail lookups during a scrape are a dict hit instead of a DataFrame scan.
+    """
+    if df is None or df.empty:
+        return {}
+    details = df["Detail"].fillna("").astype(str).str.strip()
+    has_detail = details != ""
+    keys = zip(
+        df.loc[has_detail, "DateTime"].astype(str),
+        df.loc[has_detail, "Currency"].astype(str).str.strip(),
+        df.loc[has_detail, "Event"].astype(str).str.strip(),
+    )
+    return dict(zip(keys, details[has_detail]))
+
+
 def merge_new_data(existing_df, new_df):
     """
     Merge new data into the existing DataFrame.
@@ -55,51 +98,52 @@ def merge_new_data(existing_df, new_df):
     For each record in new_df:
       - If the record does not exist in existing_df, append it.
       - If the record exists:
+          - Non-empty 'Actual', 'Forecast' and 'Previous' values of the new record
+            replace the existing ones.
           - If the existing record's 'Detail' field is empty and the new record contains details,
             update the 'Detail' field.
-          - Otherwise, leave the record unchanged.
 
-    A unique key is generated by concatenating DateTime, Currency, and Event.
+    Records are matched on the stripped (DateTime, Currency, Event) columns. The key
+    need not be unique: every existing row with a matching key is updated.
     """
     if existing_df.empty:
         return new_df
 
-    def add_unique_key(df):
-        df = df.copy()
-        df['unique_key'] = (
-            df["DateTime"].astype(str).str.strip() + "_" +
-            df["Currency"].astype(str).str.strip() + "_" +
-            df["Event"].astype(str).str.strip()
-        )
-        return df
-
-    existing_df = add_unique_key(existing_df)
-    new_df = add_unique_key(new_df)
-
-    # Use the unique key as the index for easy lookup
-    existing_df.set_index('unique_key', inplace=True)
-    new_df.set_index('unique_key', inplace=True)
-
-    # Accumulate new rows that are not present in existing_df
-    new_rows_list = []
-    for key, new_row in new_df.iterrows():
-        if key in existing_df.index:
-            # Retrieve the 'Detail' field for comparison
-            existing_detail = str(existing_df.at[key, "Detail"]).strip() if pd.notna(existing_df.at[key, "Detail"]) else ""
-            new_detail = str(new_row["Detail"]).strip() if pd.notna(new_row["Detail"]) else ""
-            # Update the 'Detail' field only if it is missing in the existing record
-            # and if the new row contains detail data.
-            if not existing_detail and new_detail:
-                existing_df.at[key, "Detail"] = new_detail
-        else:
-            new_rows_list.append(new_row)
-
-    if new_rows_list:
-        new_rows_df = pd.DataFrame(new_rows_list)
-        # Concatenate new rows with the existing DataFrame
-        existing_df = pd.concat([existing_df, new_rows_df])
-
-    # Reset the index and ensure the DataFrame has the original column order
-    merged_df = existing_df.reset_index(drop=True)
-    merged_df = merged_df[CSV_COLUMNS]
-    return merged_df
+    def row_keys(df):
+        return pd.MultiIndex.from_arrays(
+            [df[col].astype(str).str.strip() for col in MERGE_KEY])
+
+    def values(df, col):
+        return df[col].fillna("").astype(str).str.strip()
+
+    existing_df = existing_df.reset_index(drop=True)
+    existing_keys = row_keys(existing_df)
+    new_keys = row_keys(new_df)
+    in_existing = new_keys.isin(existing_keys)
+
+    def update(col, rows):
+        # Map the key of each selected existing row to the new row's non-empty value
+        new_values = {key: value for key, value
+                      in zip(new_keys[in_existing], values(new_df, col)[in_existing]) if value}
+        if new_values:
+            fill = pd.Series(existing_keys[rows].to_flat_index(),
+                             index=existing_df.index[rows]).map(new_values)
+            fill = fill.dropna()
+            if not fill.empty:
+                existing_df.loc[fill.index, col] = fill
+
+    # Rescraped values replace the existing ones (e.g. an actual released since)
+    for col in VALUE_COLUMNS:
+        update(col, slice(None))
+    # Update the 'Detail' field only if it is missing in the existing record
+    # and if the new row contains detail data.
+    update("Detail", (values(existing_df, "Detail") == "").to_numpy())
+
+    # New rows are selected column-wise and appended in one concat, after the
+    # existing ones (callers rely on that order)
+    new_rows_df = new_df[~in_existing]
+    if not new_rows_df.empty:
+        existing_df = pd.concat([existing_df[CSV_COLUMNS], new_rows_df[CSV_COLUMNS]],
+                                ignore_index=True)
+
+    return existing_df[CSV_COLUMNS]
@@ -0,0 +1,53 @@
+# src/forexfactory/utils/detail_cache.py
+
+import sqlite3
+import time
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class DetailCache:
+    """
+    SQLite store of scraped event details keyed by (DateTime, Currency, Event).
+
+    Survives runs that never reach the CSV (interrupted, no output_csv, or the
+    CSV was deleted), so a detail is clicked open at most once.
+    """
+
+    def __init__(self, path: str):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS detail ("
+            "datetime TEXT NOT NULL, currency TEXT NOT NULL, event TEXT NOT NULL, "
+            "value TEXT NOT NULL, fetched_at INTEGER NOT NULL, "
+            "PRIMARY KEY (datetime, currency, event))")
+        self.conn.commit()
+
+    def load(self) -> dict[tuple[str, str, str], str]:
+        """
+        Return every cached detail, in the same shape as csv_util.build_detail_index.
+        """
+        rows = self.conn.execute("SELECT datetime, currency, event, value FROM detail")
+        return {(dt, cur, ev): value for dt, cur, ev, value in rows}
+
+    def store(self, details: dict[tuple[str, str, str], str]) -> None:
+        """
+        Insert or replace the given details in a single transaction.
+        """
+        if not details:
+            return
+        now = int(time.time())
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO detail VALUES (?, ?, ?, ?, ?)",
+                [(dt, cur, ev, value, now) for (dt, cur, ev), value in details.items()])
+
+    def close(self) -> None:
+        """
+        Close the SQLite connection.
+        """
+        self.conn.close()
@@ -1,13 +1,28 @@
 # src/forexfactory/utils/logging.py
 import logging
-from rich.logging import RichHandler
 
-def configure_logging(level: int = logging.DEBUG) -> None:
-    """Configure root logger with RichHandler."""
+def configure_logging(level: int = logging.INFO, rich: bool = True) -> None:
+    """
+    Configure root logger with RichHandler, or a plain StreamHandler if rich is False.
+
+    DEBUG logs every calendar row, which is slow to render with Rich, so it
+    is no longer the default level. The chatty nodriver and websockets loggers
+    are capped at WARNING either way.
+    """
+    if rich:
+        from rich.logging import RichHandler
+        handler = RichHandler(rich_tracebacks=True, show_time=True, show_path=True)
+    else:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(
+            "%(asctime)s %(levelname)s %(funcName)s(%(lineno)d): %(message)s",
+            datefmt="%X"))
+
     logging.basicConfig(
         level=level,
         format="%(funcName)s(%(lineno)d): %(message)s",
         datefmt="[%X]",
-        handlers=[RichHandler(
-            rich_tracebacks=True, show_time=True, show_path=True)]
-    )
\ No newline at end of file
+        handlers=[handler]
+    )
+    logging.getLogger("nodriver").setLevel(logging.WARNING)
+    logging.getLogger("websockets").setLevel(logging.WARNING)
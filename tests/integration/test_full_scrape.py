@@ -47,6 +47,20 @@ class TestFullScrape(unittest.IsolatedAsyncioTestCase):
         # Check CSV was created
         self.assertTrue(os.path.exists(self.output_file))
 
+    async def test_scrape_single_day_with_details(self):
+        """Test scraping details fills the Detail column."""
+        start_dt = datetime(2025, 11, 24)
+        end_dt = datetime(2025, 11, 24)
+
+        df = await scrape_range_pandas(
+            from_date=start_dt,
+            to_date=end_dt,
+            scrape_details=True
+        )
+
+        self.assertGreater(len(df), 0)
+        self.assertTrue((df['Detail'] != "").any(), "Should have at least one detail")
+
     async def test_scrape_returns_dataframe_without_csv(self):
         """Test scraping without saving to CSV."""
         start_dt = datetime(2025, 11, 24)
@@ -0,0 +1,114 @@
+"""Unit tests for csv_util module."""
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from forexfactory.utils.csv_util import (CSV_COLUMNS, append_data_to_csv, build_detail_index,
+    ensure_csv_header, merge_new_data, read_existing_data)
+
+
+def _frame(*rows):
+    """Build a CSV-shaped DataFrame from (DateTime, Currency, Event, Detail) tuples."""
+    return pd.DataFrame([
+        {"DateTime": dt, "Currency": cur, "Impact": "", "Event": ev,
+         "Actual": "", "Forecast": "", "Previous": "", "Detail": detail}
+        for dt, cur, ev, detail in rows
+    ], columns=CSV_COLUMNS)
+
+
+class TestMergeNewData(unittest.TestCase):
+    """Tests for merge_new_data function."""
+
+    def test_empty_existing(self):
+        new_df = _frame(("2025-11-24T08:30:00", "USD", "NFP", ""))
+        merged = merge_new_data(_frame(), new_df)
+        self.assertEqual(len(merged), 1)
+
+    def test_appends_new_rows(self):
+        existing = _frame(("2025-11-24T08:30:00", "USD", "NFP", ""))
+        new_df = _frame(("2025-11-24T08:30:00", "USD", "NFP", ""),
+                        ("2025-11-24T10:00:00", "EUR", "German ifo", ""))
+        merged = merge_new_data(existing, new_df)
+        self.assertEqual(len(merged), 2)
+        self.assertEqual(list(merged.columns), CSV_COLUMNS)
+        self.assertEqual(merged["Event"].tolist(), ["NFP", "German ifo"])
+
+    def test_fills_missing_detail(self):
+        existing = _frame(("2025-11-24T08:30:00", "USD", "NFP", ""))
+        new_df = _frame(("2025-11-24T08:30:00", "USD", "NFP", "Source: BLS"))
+        merged = merge_new_data(existing, new_df)
+        self.assertEqual(len(merged), 1)
+        self.assertEqual(merged["Detail"].iloc[0], "Source: BLS")
+
+    def test_keeps_existing_detail(self):
+        existing = _frame(("2025-11-24T08:30:00", "USD", "NFP", "Old"))
+        new_df = _frame(("2025-11-24T08:30:00", "USD", "NFP", "New"))
+        merged = merge_new_data(existing, new_df)
+        self.assertEqual(merged["Detail"].iloc[0], "Old")
+
+    def test_updates_rescraped_values(self):
+        existing = _frame(("2025-11-24T08:30:00", "USD", "NFP", ""),
+                          ("2025-11-24T10:00:00", "EUR", "German ifo", ""))
+        existing["Actual"] = ["", "88.1"]
+        existing["Forecast"] = ["200K", "88.0"]
+        new_df = _frame(("2025-11-24T08:30:00", "USD", "NFP", ""),
+                        ("2025-11-24T10:00:00", "EUR", "German ifo", ""))
+        new_df["Actual"] = ["227K", ""]
+        new_df["Forecast"] = ["210K", "88.0"]
+        merged = merge_new_data(existing, new_df)
+        self.assertEqual(merged["Actual"].tolist(), ["227K", "88.1"])
+        self.assertEqual(merged["Forecast"].tolist(), ["210K", "88.0"])
+
+    def test_duplicate_existing_keys(self):
+        existing = _frame(("2025-11-24T08:30:00", "USD", "NFP", ""),
+                          ("2025-11-24T08:30:00", "USD", "NFP", ""))
+        new_df = _frame(("2025-11-24T08:30:00", "USD", "NFP", "Source: BLS"))
+        merged = merge_new_data(existing, new_df)
+        self.assertEqual(merged["Detail"].tolist(), ["Source: BLS", "Source: BLS"])
+        self.assertEqual(existing["Detail"].tolist(), ["", ""])
+
+
+class TestBuildDetailIndex(unittest.TestCase):
+    """Tests for build_detail_index function."""
+
+    def test_empty(self):
+        self.assertEqual(build_detail_index(_frame()), {})
+
+    def test_indexes_non_empty_details(self):
+        df = _frame(("2025-11-24T08:30:00", " USD ", "NFP", "Source: BLS "),
+                    ("2025-11-24T10:00:00", "EUR", "German ifo", ""),
+                    ("2025-11-24T11:00:00", "GBP", "CPI", None))
+        self.assertEqual(build_detail_index(df),
+                         {("2025-11-24T08:30:00", "USD", "NFP"): "Source: BLS"})
+
+
+class TestAppendDataToCsv(unittest.TestCase):
+    """Tests for append_data_to_csv function."""
+
+    def test_appends_below_header(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "events.csv")
+            ensure_csv_header(path)
+            append_data_to_csv(_frame(("2025-11-24T08:30:00", "USD", "NFP", "")), path)
+            append_data_to_csv(_frame(("2025-11-25T10:00:00", "EUR", "German ifo", "")), path)
+            df = read_existing_data(path)
+        self.assertEqual(list(df.columns), CSV_COLUMNS)
+        self.assertEqual(df["Event"].tolist(), ["NFP", "German ifo"])
+
+    def test_rewrites_legacy_header(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "events.csv")
+            _frame(("2025-11-24T08:30:00", "USD", "NFP", "")).drop(columns="Detail").to_csv(
+                path, index=False)
+            append_data_to_csv(_frame(("2025-11-25T10:00:00", "EUR", "German ifo", "x")), path)
+            append_data_to_csv(_frame(("2025-11-26T10:00:00", "GBP", "CPI", "")), path)
+            df = read_existing_data(path)
+        self.assertEqual(list(df.columns), CSV_COLUMNS)
+        self.assertEqual(df["Event"].tolist(), ["NFP", "German ifo", "CPI"])
+        self.assertEqual(df["Detail"].tolist(), ["", "x", ""])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+"""Unit tests for detail_cache module."""
+import os
+import tempfile
+import unittest
+
+from forexfactory.utils.detail_cache import DetailCache
+
+
+class TestDetailCache(unittest.TestCase):
+    """Tests for DetailCache class."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "details.sqlite")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_empty(self):
+        cache = DetailCache(self.path)
+        self.assertEqual(cache.load(), {})
+        cache.close()
+
+    def test_persists_across_instances(self):
+        key = ("2025-11-24T08:30:00", "USD", "NFP")
+        cache = DetailCache(self.path)
+        cache.store({key: "Old"})
+        cache.store({key: "Source: BLS"})
+        cache.close()
+
+        cache = DetailCache(self.path)
+        self.assertEqual(cache.load(), {key: "Source: BLS"})
+        cache.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
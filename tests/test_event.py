@@ -1,9 +1,9 @@
 """Unit tests for event module."""
 import unittest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from forexfactory.event import (
-    CalendarEvent, Impact, normalize_impact, parse_time_to_datetime
+    CalendarEvent, Impact, currency_for_symbol, normalize_impact, parse_time_to_datetime
 )
 from forex_common import Currency
 
@@ -31,6 +31,23 @@ class TestNormalizeImpact(unittest.TestCase):
         self.assertEqual(normalize_impact(""), Impact.UNKNOWN)
         self.assertEqual(normalize_impact("something else"), Impact.UNKNOWN)
 
+    def test_slow_path_is_remembered(self):
+        # Text missing from the seeded map is classified by substring, case-insensitively,
+        # and a repeat lookup returns the same result
+        for text, impact in (("HIGH Impact", Impact.HIGH), ("Medium-ish", Impact.MEDIUM),
+                             ("low impact expected", Impact.LOW), ("Bank Holiday", Impact.HOLIDAY),
+                             ("Unrated", Impact.UNKNOWN)):
+            self.assertEqual(normalize_impact(text), impact, text)
+            self.assertEqual(normalize_impact(text), impact, text)
+
+
+class TestCurrencyForSymbol(unittest.TestCase):
+    """Tests for currency_for_symbol function."""
+
+    def test_repeated_symbol_shares_currency(self):
+        self.assertIs(currency_for_symbol("USD"), currency_for_symbol("USD"))
+        self.assertIsInstance(currency_for_symbol("EUR"), Currency)
+
 
 class TestParseTimeToDatetime(unittest.TestCase):
     """Tests for parse_time_to_datetime function."""
@@ -61,6 +78,28 @@ class TestParseTimeToDatetime(unittest.TestCase):
         self.assertEqual(result.hour, 0)
         self.assertEqual(result.minute, 0)
 
+    def test_space_before_ampm(self):
+        result = parse_time_to_datetime("9:05 PM", self.base_date)
+        self.assertEqual(result.hour, 21)
+        self.assertEqual(result.minute, 5)
+
+    def test_24_hour_time(self):
+        result = parse_time_to_datetime("16:15", self.base_date)
+        self.assertEqual(result.hour, 16)
+        self.assertEqual(result.minute, 15)
+
+    def test_no_time(self):
+        result = parse_time_to_datetime("Tentative", self.base_date)
+        self.assertEqual(result, self.base_date)
+
+    def test_same_instant_different_offset(self):
+        plus_one = timezone(timedelta(hours=1))
+        first = parse_time_to_datetime("8:30am", datetime(2025, 11, 24, 10, tzinfo=plus_one))
+        second = parse_time_to_datetime("8:30am", datetime(2025, 11, 24, 9, tzinfo=timezone.utc))
+        self.assertEqual(first.utcoffset(), timedelta(hours=1))
+        self.assertEqual(second.utcoffset(), timedelta(0))
+        self.assertEqual((second.hour, second.minute), (8, 30))
+
 
 class TestCalendarEvent(unittest.TestCase):
     """Tests for CalendarEvent dataclass."""
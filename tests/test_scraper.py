@@ -0,0 +1,69 @@
+"""Unit tests for scraper module helpers."""
+import unittest
+from datetime import date, datetime, timedelta, timezone
+
+import pandas as pd
+
+from forexfactory.event import CalendarEvent, Impact
+from forexfactory.scraper import _days_to_scrape, events_to_dataframe
+from forexfactory.utils.csv_util import CSV_COLUMNS
+from forex_common import Currency
+
+
+class TestEventsToDataframe(unittest.TestCase):
+    """Tests for events_to_dataframe function."""
+
+    def test_empty(self):
+        df = events_to_dataframe([])
+        self.assertEqual(list(df.columns), CSV_COLUMNS)
+        for col in CSV_COLUMNS:
+            self.assertTrue(pd.api.types.is_string_dtype(df[col]), col)
+
+    def test_same_wall_time_different_offsets(self):
+        # 01:30 on a DST fall-back day occurs twice, an hour apart
+        edt, est = timezone(timedelta(hours=-4)), timezone(timedelta(hours=-5))
+        events = [CalendarEvent(time=datetime(2025, 11, 2, 1, 30, tzinfo=tz),
+                                currency=Currency(symbol="USD"), impact=Impact.LOW, event="X")
+                  for tz in (edt, est)]
+        df = events_to_dataframe(events)
+        self.assertEqual(df["DateTime"].tolist(),
+                         ["2025-11-02T01:30:00-04:00", "2025-11-02T01:30:00-05:00"])
+
+    def test_same_instant_different_offsets(self):
+        events = [CalendarEvent(time=datetime(2025, 11, 24, hour, tzinfo=tz),
+                                currency=Currency(symbol="USD"), impact=Impact.LOW, event="X")
+                  for hour, tz in ((9, timezone.utc), (10, timezone(timedelta(hours=1))))]
+        df = events_to_dataframe(events)
+        self.assertEqual(df["DateTime"].tolist(),
+                         ["2025-11-24T09:00:00+00:00", "2025-11-24T10:00:00+01:00"])
+
+    def test_none_values_become_empty(self):
+        event = CalendarEvent(time=datetime(2025, 11, 24, 8, 30, tzinfo=timezone.utc),
+                              currency=Currency(symbol="USD"), impact=Impact.UNKNOWN,
+                              event="NFP", forecast="200K")
+        row = events_to_dataframe([event]).iloc[0]
+        self.assertEqual([row["Impact"], row["Actual"], row["Forecast"], row["Previous"],
+                          row["Detail"]], ["", "", "200K", "", ""])
+
+
+class TestDaysToScrape(unittest.TestCase):
+    """Tests for _days_to_scrape function."""
+
+    def test_skips_covered_days_outside_refresh_window(self):
+        existing = pd.DataFrame([
+            {"DateTime": f"2025-11-{day}T08:30:00+00:00", "Event": "NFP"}
+            for day in (20, 21, 24, 25, 27)
+        ], columns=CSV_COLUMNS)
+        days = [datetime(2025, 11, day) for day in range(20, 29)]
+        queued = _days_to_scrape(days, existing, date(2025, 11, 26))
+        # 20, 21: covered; 22, 23: not covered; 24 onwards: refresh window (today - 2)
+        self.assertEqual([d.day for d in queued], [22, 23, 24, 25, 26, 27, 28])
+
+    def test_empty_existing(self):
+        days = [datetime(2025, 11, 20), datetime(2025, 11, 21)]
+        queued = _days_to_scrape(days, pd.DataFrame(columns=CSV_COLUMNS), date(2025, 11, 26))
+        self.assertEqual(queued, days)
+
+
+if __name__ == '__main__':
+    unittest.main()
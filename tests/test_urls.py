@@ -8,7 +8,8 @@ from dateutil.tz import gettz
 #   from src.forexfactory.main import build_url_for_partial_range, build_url_for_full_month
 #
 # یا اگر بعداً به فایل جدا مثلاً date_logic.py منتقل کردید، آن را اصلاح کنید.
-from src.forexfactory.date_logic import build_url_for_partial_range, build_url_for_full_month
+from src.forexfactory.date_logic import (build_url_for_day, build_url_for_partial_range,
+    build_url_for_full_month)
 
 
 class TestUrlBuilders(unittest.TestCase):
@@ -32,6 +33,10 @@ class TestUrlBuilders(unittest.TestCase):
         result = build_url_for_full_month(2025, 1)
         self.assertEqual(result, "month=jan.2025")
 
+    def test_build_url_for_day(self):
+        self.assertEqual(build_url_for_day(datetime(2025, 11, 5)), "day=nov05.2025")
+        self.assertEqual(build_url_for_day(datetime(2024, 12, 20)), "day=dec20.2024")
+
 
 if __name__ == '__main__':
     unittest.main()